@@ -0,0 +1,71 @@
+from collections.abc import Coroutine
+
+
+cdef class _BaseRequestContextManager:
+
+    cdef readonly object _coro
+    cdef readonly object _resp
+
+    def __init__(self, coro):
+        self._coro = coro
+
+    def send(self, arg):
+        return self._coro.send(arg)
+
+    def throw(self, arg):
+        self._coro.throw(arg)
+
+    def close(self):
+        return self._coro.close()
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    def __iter__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self):
+        self._resp = await self._coro
+        return self._resp
+
+
+cdef class _RequestContextManager(_BaseRequestContextManager):
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # We're basing behavior on the exception as it can be caused by
+        # user code unrelated to the status of the connection.  If you
+        # would like to close a connection you must do that
+        # explicitly.  Otherwise connection error handling should kick in
+        # and close/recycle the connection as required.
+        self._resp.release()
+
+
+cdef class _WSRequestContextManager(_BaseRequestContextManager):
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._resp.close()
+
+
+cdef class _SessionRequestContextManager:
+
+    cdef readonly object _coro
+    cdef readonly object _resp
+    cdef readonly object _session
+
+    def __init__(self, coro, session):
+        self._coro = coro
+        self._resp = None
+        self._session = session
+
+    async def __aenter__(self):
+        self._resp = await self._coro
+        return self._resp
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._resp.close()
+        await self._session.close()
+
+
+# keep isinstance() checks against collections.abc working
+# for the C implementations
+Coroutine.register(_BaseRequestContextManager)
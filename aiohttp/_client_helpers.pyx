@@ -0,0 +1,39 @@
+from multidict import (CIMultiDict, CIMultiDictProxy, MultiDict,
+                       MultiDictProxy, istr)
+
+
+def prepare_headers(default_headers, tuple default_items, headers):
+    """Merge *headers* over *default_headers* into a fresh CIMultiDict.
+
+    Keep the semantics in sync with the pure-Python
+    implementation in aiohttp/client.py.
+    """
+    cdef dict deduped
+    cdef list extras
+    cdef object result, key, value, headers_type
+
+    if not headers:
+        return default_headers.copy()
+    if not default_items and isinstance(headers, CIMultiDict):
+        return headers.copy()
+    result = default_headers.copy()
+    if isinstance(headers, dict):
+        result.update(headers)
+        return result
+    headers_type = type(headers)
+    if (headers_type is not CIMultiDict and
+            headers_type is not CIMultiDictProxy and
+            not isinstance(headers, (MultiDictProxy, MultiDict))):
+        headers = CIMultiDict(headers)
+    deduped = {}
+    extras = []
+    for key, value in headers.items():
+        key = istr(key)
+        if key in deduped:
+            extras.append((key, value))
+        else:
+            deduped[key] = value
+    result.update(deduped)
+    if extras:
+        result.extend(extras)
+    return result
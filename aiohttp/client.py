@@ -2,21 +2,26 @@
 
 import asyncio
 import base64
+import functools
 import hashlib
 import json
 import os
 import sys
 import traceback
 import warnings
-from types import SimpleNamespace, TracebackType
+import weakref
+from collections.abc import Coroutine as AbstractCoroutine
+from types import FrameType, SimpleNamespace, TracebackType
 from typing import (  # noqa
     Any,
     Coroutine,
+    Dict,
     Generator,
     Generic,
     Iterable,
     List,
     Mapping,
+    MutableMapping,
     Optional,
     Set,
     Tuple,
@@ -26,7 +31,13 @@ from typing import (  # noqa
 )
 
 import attr
-from multidict import CIMultiDict, MultiDict, MultiDictProxy, istr
+from multidict import (
+    CIMultiDict,
+    CIMultiDictProxy,
+    MultiDict,
+    MultiDictProxy,
+    istr,
+)
 from yarl import URL
 
 from . import hdrs, http, payload
@@ -68,6 +79,7 @@ from .connector import (
 )
 from .cookiejar import CookieJar
 from .helpers import (
+    NO_EXTENSIONS,
     PY_36,
     BasicAuth,
     CeilTimeout,
@@ -159,20 +171,256 @@ DEFAULT_TIMEOUT = ClientTimeout(total=5*60)
 
 _RetType = TypeVar('_RetType')
 
+_REDIRECT_STATUSES = frozenset((301, 302, 303, 307, 308))
+_POST_TO_GET_STATUSES = frozenset((301, 302))
+_ALLOWED_SCHEMES = frozenset(('http', 'https', ''))
+
+# Shared by every request that supplies no proxy headers; the proxy
+# connection path never mutates it.
+_EMPTY_HEADERS = CIMultiDictProxy(CIMultiDict())  # type: CIMultiDictProxy[str]
+
+_WS_DEFAULT_HEADERS = (
+    (hdrs.UPGRADE, hdrs.WEBSOCKET),
+    (hdrs.CONNECTION, hdrs.UPGRADE),
+    (hdrs.SEC_WEBSOCKET_VERSION, '13'),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_url(str_url: str) -> URL:
+    # URL parsing dominates the per-request setup cost; URL objects are
+    # immutable so hitting the same endpoint repeatedly can share them.
+    return URL(str_url)
+
+
+@functools.lru_cache(maxsize=128)
+def _timeout_from_scalar(timeout: float) -> ClientTimeout:
+    # ClientTimeout is frozen, so requests passing the same scalar
+    # (e.g. timeout=30) can share one instance.
+    return ClientTimeout(total=timeout)
+
+
+@functools.lru_cache(maxsize=32)
+def _proxies_from_env_cached(
+        http_proxy: Optional[str],
+        https_proxy: Optional[str],
+        ws_proxy: Optional[str],
+        wss_proxy: Optional[str],
+        no_proxy: Optional[str],
+        netrc: Optional[str]
+) -> Mapping[str, Any]:
+    # The arguments only serve as the cache key; the environment is
+    # re-scanned whenever any of the proxy variables change.
+    return proxies_from_env()
+
+
+def _get_env_proxies() -> Mapping[str, Any]:
+    environ = os.environ
+    return _proxies_from_env_cached(
+        environ.get('http_proxy') or environ.get('HTTP_PROXY'),
+        environ.get('https_proxy') or environ.get('HTTPS_PROXY'),
+        environ.get('ws_proxy') or environ.get('WS_PROXY'),
+        environ.get('wss_proxy') or environ.get('WSS_PROXY'),
+        environ.get('no_proxy') or environ.get('NO_PROXY'),
+        environ.get('NETRC'))
+
+
+class _DeprecatedProperty:
+    """Read-only property that warns about deprecation once.
+
+    ClientSession defines __slots__, so the classic self-replacing
+    descriptor (caching the value into the instance dict) cannot
+    apply; a one-shot flag on the descriptor itself gives the same
+    O(1) cost after the first access.
+    """
+
+    __slots__ = ('_fget', '_message', '_warned')
+
+    def __init__(self, fget: Any, message: str) -> None:
+        self._fget = fget
+        self._message = message
+        self._warned = False
+
+    def __get__(self, obj: Any, owner: Any=None) -> Any:
+        if obj is None:
+            return self
+        if not self._warned:
+            self._warned = True
+            warnings.warn(self._message, DeprecationWarning, stacklevel=2)
+        return self._fget(obj)
+
+
+def _py_prepare_headers(
+        default_headers: 'CIMultiDictProxy[str]',
+        default_items: Tuple[Tuple[str, str], ...],
+        headers: Optional[LooseHeaders]) -> 'CIMultiDict[str]':
+    """Merge headers over default_headers into a fresh CIMultiDict."""
+    if not headers:
+        # C-level clone of the defaults, cheaper than CIMultiDict(...)
+        return default_headers.copy()
+    if not default_items and isinstance(headers, CIMultiDict):
+        # nothing to merge, clone to preserve mutation safety
+        return headers.copy()
+    # clone the frozen defaults template at C level and lay the
+    # per-request headers over it, making the merge O(#overrides)
+    result = default_headers.copy()
+    if isinstance(headers, dict):
+        # a plain dict cannot carry duplicate keys,
+        # no per-key tracking is needed
+        result.update(headers)
+        return result
+    # single pointer comparison for the overwhelmingly common types,
+    # isinstance() with a tuple walks the MRO twice
+    headers_type = type(headers)
+    if (headers_type is not CIMultiDict and
+            headers_type is not CIMultiDictProxy and
+            not isinstance(headers, (MultiDictProxy, MultiDict))):
+        headers = CIMultiDict(headers)
+    # fold the incoming headers into a first-occurrence dict plus the
+    # remaining duplicates, then merge with two C-level batch calls
+    # instead of one interpreter-dispatched add per header
+    deduped = {}  # type: Dict[istr, str]
+    extras = []  # type: List[Tuple[istr, str]]
+    for key, value in headers.items():
+        # normalize for the case-insensitive comparison,
+        # plain str keys would let 'h1' and 'H1' slip past
+        # each other and override defaults twice
+        key = istr(key)
+        if key in deduped:
+            extras.append((key, value))
+        else:
+            deduped[key] = value
+    result.update(deduped)
+    if extras:
+        result.extend(extras)
+    return result
+
+
+_prepare_headers = _py_prepare_headers
+
+try:
+    from aiohttp._client_helpers import (  # type: ignore  # noqa
+        prepare_headers as _c_prepare_headers,
+    )
+    if not NO_EXTENSIONS:
+        _prepare_headers = _c_prepare_headers  # type: ignore
+except ImportError:  # pragma: no cover
+    pass
+
+
+try:
+    from types import GenericAlias
+except ImportError:  # pragma: no cover  # Python < 3.9
+    GenericAlias = None  # type: ignore
+
+_base_cm_bases = () if GenericAlias is not None else (Generic[_RetType],)
+
+
+# Coroutine is deliberately not a base class: the ABCMeta machinery
+# would tax every instantiation while the interpreter only needs
+# __await__ structurally.  The virtual registration below keeps
+# isinstance() checks working for third-party code.
+class _BaseRequestContextManager(*_base_cm_bases):  # type: ignore
+
+    __slots__ = ('_coro', '_resp', 'send', 'throw', 'close')
+
+    if GenericAlias is not None:
+        # subscript support for annotations without pulling in
+        # typing.Generic's __init_subclass__/__mro_entries__ machinery,
+        # the same trick the stdlib collections grew in 3.9
+        __class_getitem__ = classmethod(GenericAlias)
+
+    def __init__(
+            self,
+            coro: Coroutine['asyncio.Future[Any]', None, _RetType]
+    ) -> None:
+        self._coro = coro
+
+    def __getattr__(self, name: str) -> Any:
+        # materialize the coroutine's bound C methods on first use so
+        # that plain `await session.get(...)` pays for the wrapper
+        # object only, not for three bound-method allocations as well;
+        # __await__ cannot be delegated this way because the
+        # interpreter looks it up on the type (the Cython classes in
+        # _client_ctx cover it)
+        if name in ('send', 'throw', 'close'):
+            val = getattr(self._coro, name)
+            setattr(self, name, val)
+            return val
+        raise AttributeError(name)
+
+    def __await__(self) -> Generator[Any, None, _RetType]:
+        ret = self._coro.__await__()
+        return ret
+
+    def __iter__(self) -> Generator[Any, None, _RetType]:
+        return self.__await__()
+
+    async def __aenter__(self) -> _RetType:
+        self._resp = await self._coro
+        return self._resp
+
+
+AbstractCoroutine.register(_BaseRequestContextManager)
+
+
+class _RequestContextManager(_BaseRequestContextManager[ClientResponse]):
+    async def __aexit__(self,
+                        exc_type: Optional[Type[BaseException]],
+                        exc: Optional[BaseException],
+                        tb: Optional[TracebackType]) -> None:
+        # We're basing behavior on the exception as it can be caused by
+        # user code unrelated to the status of the connection.  If you
+        # would like to close a connection you must do that
+        # explicitly.  Otherwise connection error handling should kick in
+        # and close/recycle the connection as required.
+        self._resp.release()
+
+
+class _WSRequestContextManager(_BaseRequestContextManager[
+        ClientWebSocketResponse]):
+    async def __aexit__(self,
+                        exc_type: Optional[Type[BaseException]],
+                        exc: Optional[BaseException],
+                        tb: Optional[TracebackType]) -> None:
+        await self._resp.close()
+
+
+PyRequestContextManager = _RequestContextManager
+PyWSRequestContextManager = _WSRequestContextManager
+
+# rebind before ClientSession's class body runs so the verb methods
+# capture the accelerated classes in their default arguments
+try:
+    from aiohttp._client_ctx import (  # type: ignore  # noqa
+        _RequestContextManager as CRequestContextManager,
+        _WSRequestContextManager as CWSRequestContextManager,
+    )
+    if not NO_EXTENSIONS:
+        _RequestContextManager = CRequestContextManager  # type: ignore
+        _WSRequestContextManager = CWSRequestContextManager  # type: ignore
+except ImportError:  # pragma: no cover
+    pass
+
 
 class ClientSession:
     """First-class interface for making HTTP requests."""
 
     __slots__ = (
-        '_source_traceback', '_connector',
+        '_source_frame', '_connector', '_closed',
         '_loop', '_cookie_jar',
         '_connector_owner', '_default_auth',
         '_version', '_json_serialize',
         '_requote_redirect_url',
         '_timeout', '_raise_for_status', '_auto_decompress',
-        '_trust_env', '_default_headers', '_skip_auto_headers',
+        '_trust_env', '_default_headers', '_default_headers_tuple',
+        '_skip_auto_headers',
         '_request_class', '_response_class',
-        '_ws_response_class', '_trace_configs')
+        '_ws_response_class', '_trace_configs', '__weakref__')
+
+    # one-shot deprecation flag, see the requote_redirect_url setter;
+    # the loop property handles this via _DeprecatedProperty
+    _requote_warned = False
 
     def __init__(self, *, connector: Optional[BaseConnector]=None,
                  loop: Optional[asyncio.AbstractEventLoop]=None,
@@ -208,11 +456,14 @@ class ClientSession:
         # Initialize these three attrs before raising any exception,
         # they are used in __del__
         self._connector = connector  # type: Optional[BaseConnector]
+        self._closed = False
         self._loop = loop
         if loop.get_debug():
-            self._source_traceback = traceback.extract_stack(sys._getframe(1))  # type: Optional[traceback.StackSummary]  # noqa
+            # Keep a frame reference only; formatting the stack is
+            # expensive and is deferred until __del__ has to report it.
+            self._source_frame = sys._getframe(1)  # type: Optional[FrameType]
         else:
-            self._source_traceback = None
+            self._source_frame = None
 
         if connector._loop is not loop:
             raise RuntimeError(
@@ -236,10 +487,17 @@ class ClientSession:
                               "use timeout argument instead",
                               DeprecationWarning,
                               stacklevel=2)
-                self._timeout = attr.evolve(self._timeout, total=read_timeout)
+                self._timeout = ClientTimeout(
+                    total=read_timeout,  # type: ignore
+                    connect=self._timeout.connect,
+                    sock_read=self._timeout.sock_read,
+                    sock_connect=self._timeout.sock_connect)
             if conn_timeout is not None:
-                self._timeout = attr.evolve(self._timeout,
-                                            connect=conn_timeout)
+                self._timeout = ClientTimeout(
+                    total=self._timeout.total,
+                    connect=conn_timeout,
+                    sock_read=self._timeout.sock_read,
+                    sock_connect=self._timeout.sock_connect)
                 warnings.warn("conn_timeout is deprecated, "
                               "use timeout argument instead",
                               DeprecationWarning,
@@ -264,7 +522,13 @@ class ClientSession:
             headers = CIMultiDict(headers)
         else:
             headers = CIMultiDict()
-        self._default_headers = headers
+        # Frozen template: per-request header preparation only ever
+        # clones it, so the always-identical part of every request's
+        # headers is copied at C level instead of being rebuilt.
+        self._default_headers = CIMultiDictProxy(headers)
+        # Precomputed for cheap per-request cloning when the caller
+        # passes no headers at all (the common case).
+        self._default_headers_tuple = tuple(headers.items())
         if skip_auto_headers is not None:
             self._skip_auto_headers = frozenset([istr(i)
                                                  for i in skip_auto_headers])
@@ -296,8 +560,9 @@ class ClientSession:
                            **kwargs)
             context = {'client_session': self,
                        'message': 'Unclosed client session'}
-            if self._source_traceback is not None:
-                context['source_traceback'] = self._source_traceback
+            if self._source_frame is not None:
+                context['source_traceback'] = \
+                    traceback.extract_stack(self._source_frame)
             self._loop.call_exception_handler(context)
 
     def request(self,
@@ -310,7 +575,7 @@ class ClientSession:
     async def _request(
             self,
             method: str,
-            str_or_url: StrOrURL, *,
+            str_or_url: StrOrURL,
             params: Optional[Mapping[str, str]]=None,
             data: Any=None,
             json: Any=None,
@@ -337,6 +602,33 @@ class ClientSession:
         # set the default to None because we need to detect if the user wants
         # to use the existing timeouts by setting timeout to None.
 
+        if (cookies is None and
+                proxy is None and
+                proxy_auth is None and
+                proxy_headers is None and
+                not self._trust_env and
+                not self._trace_configs):
+            # the majority of requests carry no tracing, per-request
+            # cookies or proxy setup; serve them from the compact
+            # specialization below
+            return await self._request_fast(
+                method, str_or_url,
+                params=params,
+                data=data,
+                json=json,
+                headers=headers,
+                skip_auto_headers=skip_auto_headers,
+                auth=auth,
+                allow_redirects=allow_redirects,
+                max_redirects=max_redirects,
+                compress=compress,
+                chunked=chunked,
+                expect100=expect100,
+                raise_for_status=raise_for_status,
+                read_until_eof=read_until_eof,
+                timeout=timeout,
+                ssl=ssl)
+
         if self.closed:
             raise RuntimeError('Session is closed')
 
@@ -357,20 +649,33 @@ class ClientSession:
         redirects = 0
         history = []
         version = self._version
+        is_head = method.upper() == hdrs.METH_HEAD
 
         # Merge with default headers and transform to CIMultiDict
-        headers = self._prepare_headers(headers)
-        proxy_headers = self._prepare_headers(proxy_headers)
+        if headers is None:
+            headers = CIMultiDict(self._default_headers_tuple)
+        else:
+            headers = self._prepare_headers(headers)
+        if proxy_headers is None and not self._default_headers:
+            proxy_headers = _EMPTY_HEADERS
+        else:
+            proxy_headers = self._prepare_headers(proxy_headers)
 
         try:
-            url = URL(str_or_url)
+            if isinstance(str_or_url, URL):
+                url = str_or_url
+            else:
+                url = _cached_url(str_or_url)
         except ValueError:
             raise InvalidURL(str_or_url)
 
-        skip_headers = set(self._skip_auto_headers)
         if skip_auto_headers is not None:
-            for i in skip_auto_headers:
-                skip_headers.add(istr(i))
+            skip_headers = self._skip_auto_headers.union(
+                istr(i) for i in skip_auto_headers)
+        else:
+            # ClientRequest treats the value as read-only,
+            # aliasing the session's frozenset is safe.
+            skip_headers = self._skip_auto_headers
 
         if proxy is not None:
             try:
@@ -380,68 +685,72 @@ class ClientSession:
 
         if timeout is sentinel:
             real_timeout = self._timeout  # type: ClientTimeout
+        elif isinstance(timeout, ClientTimeout):
+            real_timeout = timeout
         else:
-            if not isinstance(timeout, ClientTimeout):
-                real_timeout = ClientTimeout(total=timeout)  # type: ignore
-            else:
-                real_timeout = timeout
+            real_timeout = _timeout_from_scalar(timeout)  # type: ignore
         # timeout is cumulative for all request operations
         # (request, redirects, responses, data consuming)
         tm = TimeoutHandle(self._loop, real_timeout.total)
         handle = tm.start()
 
-        traces = [
-            Trace(
-                self,
-                trace_config,
-                trace_config.trace_config_ctx(
-                    trace_request_ctx=trace_request_ctx)
-            )
-            for trace_config in self._trace_configs
-        ]
-
-        for trace in traces:
-            await trace.send_request_start(
-                method,
-                url,
-                headers
-            )
+        if self._trace_configs:
+            traces = [
+                Trace(
+                    self,
+                    trace_config,
+                    trace_config.trace_config_ctx(
+                        trace_request_ctx=trace_request_ctx)
+                )
+                for trace_config in self._trace_configs
+            ]
+            if len(traces) == 1:
+                await traces[0].send_request_start(method, url, headers)
+            else:
+                await asyncio.gather(*(trace.send_request_start(method,
+                                                                url,
+                                                                headers)
+                                       for trace in traces))
+        else:
+            traces = []
 
         timer = tm.timer()
         try:
             with timer:
+                # The no-redirect case is by far the most common one,
+                # so auth extraction and cookie filtering are done once
+                # up front and recomputed only when a redirect actually
+                # changes the URL.
+                url, auth_from_url = strip_auth_from_url(url)
+                if auth and auth_from_url:
+                    raise ValueError("Cannot combine AUTH argument with "
+                                     "credentials encoded in URL")
+
+                if auth is None:
+                    auth = auth_from_url
+                if auth is None:
+                    auth = self._default_auth
+                # It would be confusing if we support explicit
+                # Authorization header with auth argument
+                if (headers is not None and
+                        auth is not None and
+                        hdrs.AUTHORIZATION in headers):
+                    raise ValueError("Cannot combine AUTHORIZATION header "
+                                     "with AUTH argument or credentials "
+                                     "encoded in URL")
+
+                all_cookies = self._cookie_jar.filter_cookies(url)
+
                 while True:
-                    url, auth_from_url = strip_auth_from_url(url)
-                    if auth and auth_from_url:
-                        raise ValueError("Cannot combine AUTH argument with "
-                                         "credentials encoded in URL")
-
-                    if auth is None:
-                        auth = auth_from_url
-                    if auth is None:
-                        auth = self._default_auth
-                    # It would be confusing if we support explicit
-                    # Authorization header with auth argument
-                    if (headers is not None and
-                            auth is not None and
-                            hdrs.AUTHORIZATION in headers):
-                        raise ValueError("Cannot combine AUTHORIZATION header "
-                                         "with AUTH argument or credentials "
-                                         "encoded in URL")
-
-                    all_cookies = self._cookie_jar.filter_cookies(url)
-
-                    if cookies is not None:
+                    if cookies:
                         tmp_cookie_jar = CookieJar()
                         tmp_cookie_jar.update_cookies(cookies)
                         req_cookies = tmp_cookie_jar.filter_cookies(url)
                         if req_cookies:
                             all_cookies.load(req_cookies)
 
-                    if proxy is not None:
-                        proxy = URL(proxy)
-                    elif self._trust_env:
-                        for scheme, proxy_info in proxies_from_env().items():
+                    if proxy is None and self._trust_env:
+                        for scheme, proxy_info in _get_env_proxies().items():
                             if scheme == url.scheme:
                                 proxy = proxy_info.proxy
                                 proxy_auth = proxy_info.proxy_auth
@@ -477,11 +786,11 @@ class ClientSession:
 
                     assert conn.protocol is not None
                     conn.protocol.set_response_params(
-                        timer=timer,
-                        skip_payload=method.upper() == 'HEAD',
-                        read_until_eof=read_until_eof,
-                        auto_decompress=self._auto_decompress,
-                        read_timeout=real_timeout.sock_read)
+                        timer,
+                        is_head,
+                        read_until_eof,
+                        self._auto_decompress,
+                        real_timeout.sock_read)
 
                     try:
                         try:
@@ -502,16 +811,17 @@ class ClientSession:
                     self._cookie_jar.update_cookies(resp.cookies, resp.url)
 
                     # redirects
-                    if resp.status in (
-                            301, 302, 303, 307, 308) and allow_redirects:
-
-                        for trace in traces:
-                            await trace.send_request_redirect(
-                                method,
-                                url,
-                                headers,
-                                resp
-                            )
+                    if resp.status in _REDIRECT_STATUSES and allow_redirects:
+
+                        if traces:
+                            if len(traces) == 1:
+                                await traces[0].send_request_redirect(
+                                    method, url, headers, resp)
+                            else:
+                                await asyncio.gather(
+                                    *(trace.send_request_redirect(
+                                        method, url, headers, resp)
+                                      for trace in traces))
 
                         redirects += 1
                         history.append(resp)
@@ -524,9 +834,10 @@ class ClientSession:
                         # https://github.com/kennethreitz/requests/pull/269
                         if (resp.status == 303 and
                                 resp.method != hdrs.METH_HEAD) \
-                                or (resp.status in (301, 302) and
+                                or (resp.status in _POST_TO_GET_STATUSES and
                                     resp.method == hdrs.METH_POST):
                             method = hdrs.METH_GET
+                            is_head = False
                             data = None
                             if headers.get(hdrs.CONTENT_LENGTH):
                                 headers.pop(hdrs.CONTENT_LENGTH)
@@ -549,7 +860,7 @@ class ClientSession:
                             raise InvalidURL(r_url)
 
                         scheme = r_url.scheme
-                        if scheme not in ('http', 'https', ''):
+                        if scheme not in _ALLOWED_SCHEMES:
                             resp.close()
                             raise ValueError(
                                 'Can redirect only to http or https')
@@ -560,9 +871,27 @@ class ClientSession:
                             auth = None
                             headers.pop(hdrs.AUTHORIZATION, None)
 
-                        url = r_url
+                        url, auth_from_url = strip_auth_from_url(r_url)
+                        if auth and auth_from_url:
+                            raise ValueError(
+                                "Cannot combine AUTH argument with "
+                                "credentials encoded in URL")
+
+                        if auth is None:
+                            auth = auth_from_url
+                        if auth is None:
+                            auth = self._default_auth
+                        if (headers is not None and
+                                auth is not None and
+                                hdrs.AUTHORIZATION in headers):
+                            raise ValueError(
+                                "Cannot combine AUTHORIZATION header "
+                                "with AUTH argument or credentials "
+                                "encoded in URL")
+
+                        all_cookies = self._cookie_jar.filter_cookies(url)
+
                         params = None
-                        resp.release()
                         continue
 
                     break
@@ -582,13 +911,14 @@ class ClientSession:
 
             resp._history = tuple(history)
 
-            for trace in traces:
-                await trace.send_request_end(
-                    method,
-                    url,
-                    headers,
-                    resp
-                )
+            if traces:
+                if len(traces) == 1:
+                    await traces[0].send_request_end(
+                        method, url, headers, resp)
+                else:
+                    await asyncio.gather(
+                        *(trace.send_request_end(method, url, headers, resp)
+                          for trace in traces))
             return resp
 
         except BaseException as e:
@@ -598,13 +928,269 @@ class ClientSession:
                 handle.cancel()
                 handle = None
 
-            for trace in traces:
-                await trace.send_request_exception(
-                    method,
-                    url,
-                    headers,
-                    e
-                )
+            if traces:
+                if len(traces) == 1:
+                    await traces[0].send_request_exception(
+                        method, url, headers, e)
+                else:
+                    await asyncio.gather(
+                        *(trace.send_request_exception(method, url,
+                                                       headers, e)
+                          for trace in traces))
+            raise
+
+    async def _request_fast(
+            self,
+            method: str,
+            str_or_url: StrOrURL, *,
+            params: Optional[Mapping[str, str]]=None,
+            data: Any=None,
+            json: Any=None,
+            headers: LooseHeaders=None,
+            skip_auto_headers: Optional[Iterable[str]]=None,
+            auth: Optional[BasicAuth]=None,
+            allow_redirects: bool=True,
+            max_redirects: int=10,
+            compress: Optional[str]=None,
+            chunked: Optional[bool]=None,
+            expect100: bool=False,
+            raise_for_status: Optional[bool]=None,
+            read_until_eof: bool=True,
+            timeout: Union[ClientTimeout, object]=sentinel,
+            ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None
+    ) -> ClientResponse:
+        # Specialization of _request for requests without tracing,
+        # per-request cookies or proxies.  Keep the semantics in sync
+        # with _request: everything here must behave exactly like the
+        # general version minus the skipped features.
+
+        if self.closed:
+            raise RuntimeError('Session is closed')
+
+        if not isinstance(ssl, SSL_ALLOWED_TYPES):
+            raise TypeError("ssl should be SSLContext, bool, Fingerprint, "
+                            "or None, got {!r} instead.".format(ssl))
+
+        if data is not None and json is not None:
+            raise ValueError(
+                'data and json parameters can not be used at the same time')
+        elif json is not None:
+            data = payload.JsonPayload(json, dumps=self._json_serialize)
+
+        if not isinstance(chunked, bool) and chunked is not None:
+            warnings.warn(
+                'Chunk size is deprecated #1615', DeprecationWarning)
+
+        redirects = 0
+        history = []
+        version = self._version
+        is_head = method.upper() == hdrs.METH_HEAD
+
+        if headers is None:
+            headers = CIMultiDict(self._default_headers_tuple)
+        else:
+            headers = self._prepare_headers(headers)
+        if not self._default_headers:
+            proxy_headers = _EMPTY_HEADERS  # type: LooseHeaders
+        else:
+            proxy_headers = self._prepare_headers(None)
+
+        try:
+            if isinstance(str_or_url, URL):
+                url = str_or_url
+            else:
+                url = _cached_url(str_or_url)
+        except ValueError:
+            raise InvalidURL(str_or_url)
+
+        if skip_auto_headers is not None:
+            skip_headers = self._skip_auto_headers.union(
+                istr(i) for i in skip_auto_headers)
+        else:
+            skip_headers = self._skip_auto_headers
+
+        if timeout is sentinel:
+            real_timeout = self._timeout  # type: ClientTimeout
+        elif isinstance(timeout, ClientTimeout):
+            real_timeout = timeout
+        else:
+            real_timeout = _timeout_from_scalar(timeout)  # type: ignore
+        tm = TimeoutHandle(self._loop, real_timeout.total)
+        handle = tm.start()
+
+        timer = tm.timer()
+        try:
+            with timer:
+                url, auth_from_url = strip_auth_from_url(url)
+                if auth and auth_from_url:
+                    raise ValueError("Cannot combine AUTH argument with "
+                                     "credentials encoded in URL")
+
+                if auth is None:
+                    auth = auth_from_url
+                if auth is None:
+                    auth = self._default_auth
+                if (headers is not None and
+                        auth is not None and
+                        hdrs.AUTHORIZATION in headers):
+                    raise ValueError("Cannot combine AUTHORIZATION header "
+                                     "with AUTH argument or credentials "
+                                     "encoded in URL")
+
+                all_cookies = self._cookie_jar.filter_cookies(url)
+
+                while True:
+                    req = self._request_class(
+                        method, url, params=params, headers=headers,
+                        skip_auto_headers=skip_headers, data=data,
+                        cookies=all_cookies, auth=auth, version=version,
+                        compress=compress, chunked=chunked,
+                        expect100=expect100, loop=self._loop,
+                        response_class=self._response_class,
+                        proxy=None, proxy_auth=None, timer=timer,
+                        session=self,
+                        ssl=ssl, proxy_headers=proxy_headers, traces=[])
+
+                    # connection timeout
+                    try:
+                        with CeilTimeout(real_timeout.connect,
+                                         loop=self._loop):
+                            assert self._connector is not None
+                            conn = await self._connector.connect(
+                                req,
+                                traces=[],
+                                timeout=real_timeout
+                            )
+                    except asyncio.TimeoutError as exc:
+                        raise ServerTimeoutError(
+                            'Connection timeout '
+                            'to host {0}'.format(url)) from exc
+
+                    assert conn.transport is not None
+
+                    assert conn.protocol is not None
+                    conn.protocol.set_response_params(
+                        timer,
+                        is_head,
+                        read_until_eof,
+                        self._auto_decompress,
+                        real_timeout.sock_read)
+
+                    try:
+                        try:
+                            resp = await req.send(conn)
+                            try:
+                                await resp.start(conn)
+                            except BaseException:
+                                resp.close()
+                                raise
+                        except BaseException:
+                            conn.close()
+                            raise
+                    except ClientError:
+                        raise
+                    except OSError as exc:
+                        raise ClientOSError(*exc.args) from exc
+
+                    self._cookie_jar.update_cookies(resp.cookies, resp.url)
+
+                    # redirects
+                    if resp.status in _REDIRECT_STATUSES and allow_redirects:
+                        redirects += 1
+                        history.append(resp)
+                        if max_redirects and redirects >= max_redirects:
+                            resp.close()
+                            raise TooManyRedirects(
+                                history[0].request_info, tuple(history))
+
+                        # For 301 and 302, mimic IE, now changed in RFC
+                        # https://github.com/kennethreitz/requests/pull/269
+                        if (resp.status == 303 and
+                                resp.method != hdrs.METH_HEAD) \
+                                or (resp.status in _POST_TO_GET_STATUSES and
+                                    resp.method == hdrs.METH_POST):
+                            method = hdrs.METH_GET
+                            is_head = False
+                            data = None
+                            if headers.get(hdrs.CONTENT_LENGTH):
+                                headers.pop(hdrs.CONTENT_LENGTH)
+
+                        r_url = (resp.headers.get(hdrs.LOCATION) or
+                                 resp.headers.get(hdrs.URI))
+                        if r_url is None:
+                            # see github.com/aio-libs/aiohttp/issues/2022
+                            break
+                        else:
+                            # reading from correct redirection
+                            # response is forbidden
+                            resp.release()
+
+                        try:
+                            r_url = URL(
+                                r_url, encoded=not self._requote_redirect_url)
+
+                        except ValueError:
+                            raise InvalidURL(r_url)
+
+                        scheme = r_url.scheme
+                        if scheme not in _ALLOWED_SCHEMES:
+                            resp.close()
+                            raise ValueError(
+                                'Can redirect only to http or https')
+                        elif not scheme:
+                            r_url = url.join(r_url)
+
+                        if url.origin() != r_url.origin():
+                            auth = None
+                            headers.pop(hdrs.AUTHORIZATION, None)
+
+                        url, auth_from_url = strip_auth_from_url(r_url)
+                        if auth and auth_from_url:
+                            raise ValueError(
+                                "Cannot combine AUTH argument with "
+                                "credentials encoded in URL")
+
+                        if auth is None:
+                            auth = auth_from_url
+                        if auth is None:
+                            auth = self._default_auth
+                        if (headers is not None and
+                                auth is not None and
+                                hdrs.AUTHORIZATION in headers):
+                            raise ValueError(
+                                "Cannot combine AUTHORIZATION header "
+                                "with AUTH argument or credentials "
+                                "encoded in URL")
+
+                        all_cookies = self._cookie_jar.filter_cookies(url)
+
+                        params = None
+                        continue
+
+                    break
+
+            # check response status
+            if raise_for_status is None:
+                raise_for_status = self._raise_for_status
+            if raise_for_status:
+                resp.raise_for_status()
+
+            # register connection
+            if handle is not None:
+                if resp.connection is not None:
+                    resp.connection.add_callback(handle.cancel)
+                else:
+                    handle.cancel()
+
+            resp._history = tuple(history)
+            return resp
+
+        except BaseException:
+            # cleanup timer
+            tm.close()
+            if handle:
+                handle.cancel()
+                handle = None
             raise
 
     def ws_connect(
@@ -667,22 +1253,24 @@ class ClientSession:
             max_msg_size: int=4*1024*1024
     ) -> ClientWebSocketResponse:
 
+        if not isinstance(ssl, SSL_ALLOWED_TYPES):
+            raise TypeError("ssl should be SSLContext, bool, Fingerprint, "
+                            "or None, got {!r} instead.".format(ssl))
+
         if headers is None:
             real_headers = CIMultiDict()  # type: CIMultiDict[str]
+        elif isinstance(headers, CIMultiDict):
+            # copy() is a C-level clone; CIMultiDict(headers) would
+            # re-iterate and re-intern every key
+            real_headers = headers.copy()
         else:
             real_headers = CIMultiDict(headers)
 
-        default_headers = {
-            hdrs.UPGRADE: hdrs.WEBSOCKET,
-            hdrs.CONNECTION: hdrs.UPGRADE,
-            hdrs.SEC_WEBSOCKET_VERSION: '13',
-        }
-
-        for key, value in default_headers.items():
+        for key, value in _WS_DEFAULT_HEADERS:
             real_headers.setdefault(key, value)
 
         sec_key = base64.b64encode(os.urandom(16))
-        real_headers[hdrs.SEC_WEBSOCKET_KEY] = sec_key.decode()
+        real_headers[hdrs.SEC_WEBSOCKET_KEY] = sec_key.decode('ascii')
 
         if protocols:
             real_headers[hdrs.SEC_WEBSOCKET_PROTOCOL] = ','.join(protocols)
@@ -692,10 +1280,6 @@ class ClientSession:
             extstr = ws_ext_gen(compress=compress)
             real_headers[hdrs.SEC_WEBSOCKET_EXTENSIONS] = extstr
 
-        if not isinstance(ssl, SSL_ALLOWED_TYPES):
-            raise TypeError("ssl should be SSLContext, bool, Fingerprint, "
-                            "or None, got {!r} instead.".format(ssl))
-
         # send request
         resp = await self.request(method, url,
                                   headers=real_headers,
@@ -734,8 +1318,10 @@ class ClientSession:
 
             # key calculation
             key = resp.headers.get(hdrs.SEC_WEBSOCKET_ACCEPT, '')
-            match = base64.b64encode(
-                hashlib.sha1(sec_key + WS_KEY).digest()).decode()
+            accept_hash = hashlib.sha1()
+            accept_hash.update(sec_key)
+            accept_hash.update(WS_KEY)
+            match = base64.b64encode(accept_hash.digest()).decode('ascii')
             if key != match:
                 raise WSServerHandshakeError(
                     resp.request_info,
@@ -747,12 +1333,11 @@ class ClientSession:
             # websocket protocol
             protocol = None
             if protocols and hdrs.SEC_WEBSOCKET_PROTOCOL in resp.headers:
-                resp_protocols = [
-                    proto.strip() for proto in
-                    resp.headers[hdrs.SEC_WEBSOCKET_PROTOCOL].split(',')]
-
-                for proto in resp_protocols:
-                    if proto in protocols:
+                protocols_set = frozenset(protocols)
+                for proto in resp.headers[
+                        hdrs.SEC_WEBSOCKET_PROTOCOL].split(','):
+                    proto = proto.strip()
+                    if proto in protocols_set:
                         protocol = proto
                         break
 
@@ -808,73 +1393,242 @@ class ClientSession:
             headers: Optional[LooseHeaders]) -> 'CIMultiDict[str]':
         """ Add default headers and transform it to CIMultiDict
         """
-        # Convert headers to MultiDict
-        result = CIMultiDict(self._default_headers)
-        if headers:
-            if not isinstance(headers, (MultiDictProxy, MultiDict)):
-                headers = CIMultiDict(headers)
-            added_names = set()  # type: Set[str]
-            for key, value in headers.items():
-                if key in added_names:
-                    result.add(key, value)
-                else:
-                    result[key] = value
-                    added_names.add(key)
-        return result
-
-    def get(self, url: StrOrURL, *, allow_redirects: bool=True,
-            **kwargs: Any) -> '_RequestContextManager':
+        return _prepare_headers(self._default_headers,
+                                self._default_headers_tuple,
+                                headers)
+
+    # The _method/_rcm arguments below are private; they bind the
+    # method constant and the (possibly accelerated) context-manager
+    # class as locals at class body time so calls do LOAD_FAST instead
+    # of global lookups.  The arguments are spelled out
+    # instead of **kwargs and forwarded positionally so no capture
+    # dict is built and re-unpacked on every call.
+
+    def get(self, url: StrOrURL, *,
+            params: Optional[Mapping[str, str]]=None,
+            data: Any=None,
+            json: Any=None,
+            cookies: Optional[LooseCookies]=None,
+            headers: LooseHeaders=None,
+            skip_auto_headers: Optional[Iterable[str]]=None,
+            auth: Optional[BasicAuth]=None,
+            allow_redirects: bool=True,
+            max_redirects: int=10,
+            compress: Optional[str]=None,
+            chunked: Optional[bool]=None,
+            expect100: bool=False,
+            raise_for_status: Optional[bool]=None,
+            read_until_eof: bool=True,
+            proxy: Optional[StrOrURL]=None,
+            proxy_auth: Optional[BasicAuth]=None,
+            timeout: Union[ClientTimeout, object]=sentinel,
+            ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None,
+            proxy_headers: Optional[LooseHeaders]=None,
+            trace_request_ctx: Optional[SimpleNamespace]=None,
+            _method: str=hdrs.METH_GET,
+            _rcm: Any=_RequestContextManager) -> '_RequestContextManager':
         """Perform HTTP GET request."""
-        return _RequestContextManager(
-            self._request(hdrs.METH_GET, url,
-                          allow_redirects=allow_redirects,
-                          **kwargs))
-
-    def options(self, url: StrOrURL, *, allow_redirects: bool=True,
-                **kwargs: Any) -> '_RequestContextManager':
+        return _rcm(
+            self._request(_method, url, params, data, json, cookies,
+                          headers, skip_auto_headers, auth,
+                          allow_redirects, max_redirects, compress,
+                          chunked, expect100, raise_for_status,
+                          read_until_eof, proxy, proxy_auth, timeout,
+                          ssl, proxy_headers, trace_request_ctx))
+
+    def options(self, url: StrOrURL, *,
+                params: Optional[Mapping[str, str]]=None,
+                data: Any=None,
+                json: Any=None,
+                cookies: Optional[LooseCookies]=None,
+                headers: LooseHeaders=None,
+                skip_auto_headers: Optional[Iterable[str]]=None,
+                auth: Optional[BasicAuth]=None,
+                allow_redirects: bool=True,
+                max_redirects: int=10,
+                compress: Optional[str]=None,
+                chunked: Optional[bool]=None,
+                expect100: bool=False,
+                raise_for_status: Optional[bool]=None,
+                read_until_eof: bool=True,
+                proxy: Optional[StrOrURL]=None,
+                proxy_auth: Optional[BasicAuth]=None,
+                timeout: Union[ClientTimeout, object]=sentinel,
+                ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None,
+                proxy_headers: Optional[LooseHeaders]=None,
+                trace_request_ctx: Optional[SimpleNamespace]=None,
+                _method: str=hdrs.METH_OPTIONS,
+                _rcm: Any=_RequestContextManager
+                ) -> '_RequestContextManager':
         """Perform HTTP OPTIONS request."""
-        return _RequestContextManager(
-            self._request(hdrs.METH_OPTIONS, url,
-                          allow_redirects=allow_redirects,
-                          **kwargs))
-
-    def head(self, url: StrOrURL, *, allow_redirects: bool=False,
-             **kwargs: Any) -> '_RequestContextManager':
+        return _rcm(
+            self._request(_method, url, params, data, json, cookies,
+                          headers, skip_auto_headers, auth,
+                          allow_redirects, max_redirects, compress,
+                          chunked, expect100, raise_for_status,
+                          read_until_eof, proxy, proxy_auth, timeout,
+                          ssl, proxy_headers, trace_request_ctx))
+
+    def head(self, url: StrOrURL, *,
+             params: Optional[Mapping[str, str]]=None,
+             data: Any=None,
+             json: Any=None,
+             cookies: Optional[LooseCookies]=None,
+             headers: LooseHeaders=None,
+             skip_auto_headers: Optional[Iterable[str]]=None,
+             auth: Optional[BasicAuth]=None,
+             allow_redirects: bool=False,
+             max_redirects: int=10,
+             compress: Optional[str]=None,
+             chunked: Optional[bool]=None,
+             expect100: bool=False,
+             raise_for_status: Optional[bool]=None,
+             read_until_eof: bool=True,
+             proxy: Optional[StrOrURL]=None,
+             proxy_auth: Optional[BasicAuth]=None,
+             timeout: Union[ClientTimeout, object]=sentinel,
+             ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None,
+             proxy_headers: Optional[LooseHeaders]=None,
+             trace_request_ctx: Optional[SimpleNamespace]=None,
+             _method: str=hdrs.METH_HEAD,
+             _rcm: Any=_RequestContextManager) -> '_RequestContextManager':
         """Perform HTTP HEAD request."""
-        return _RequestContextManager(
-            self._request(hdrs.METH_HEAD, url,
-                          allow_redirects=allow_redirects,
-                          **kwargs))
-
-    def post(self, url: StrOrURL,
-             *, data: Any=None, **kwargs: Any) -> '_RequestContextManager':
+        return _rcm(
+            self._request(_method, url, params, data, json, cookies,
+                          headers, skip_auto_headers, auth,
+                          allow_redirects, max_redirects, compress,
+                          chunked, expect100, raise_for_status,
+                          read_until_eof, proxy, proxy_auth, timeout,
+                          ssl, proxy_headers, trace_request_ctx))
+
+    def post(self, url: StrOrURL, *,
+             params: Optional[Mapping[str, str]]=None,
+             data: Any=None,
+             json: Any=None,
+             cookies: Optional[LooseCookies]=None,
+             headers: LooseHeaders=None,
+             skip_auto_headers: Optional[Iterable[str]]=None,
+             auth: Optional[BasicAuth]=None,
+             allow_redirects: bool=True,
+             max_redirects: int=10,
+             compress: Optional[str]=None,
+             chunked: Optional[bool]=None,
+             expect100: bool=False,
+             raise_for_status: Optional[bool]=None,
+             read_until_eof: bool=True,
+             proxy: Optional[StrOrURL]=None,
+             proxy_auth: Optional[BasicAuth]=None,
+             timeout: Union[ClientTimeout, object]=sentinel,
+             ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None,
+             proxy_headers: Optional[LooseHeaders]=None,
+             trace_request_ctx: Optional[SimpleNamespace]=None,
+             _method: str=hdrs.METH_POST,
+             _rcm: Any=_RequestContextManager) -> '_RequestContextManager':
         """Perform HTTP POST request."""
-        return _RequestContextManager(
-            self._request(hdrs.METH_POST, url,
-                          data=data,
-                          **kwargs))
-
-    def put(self, url: StrOrURL,
-            *, data: Any=None, **kwargs: Any) -> '_RequestContextManager':
+        return _rcm(
+            self._request(_method, url, params, data, json, cookies,
+                          headers, skip_auto_headers, auth,
+                          allow_redirects, max_redirects, compress,
+                          chunked, expect100, raise_for_status,
+                          read_until_eof, proxy, proxy_auth, timeout,
+                          ssl, proxy_headers, trace_request_ctx))
+
+    def put(self, url: StrOrURL, *,
+            params: Optional[Mapping[str, str]]=None,
+            data: Any=None,
+            json: Any=None,
+            cookies: Optional[LooseCookies]=None,
+            headers: LooseHeaders=None,
+            skip_auto_headers: Optional[Iterable[str]]=None,
+            auth: Optional[BasicAuth]=None,
+            allow_redirects: bool=True,
+            max_redirects: int=10,
+            compress: Optional[str]=None,
+            chunked: Optional[bool]=None,
+            expect100: bool=False,
+            raise_for_status: Optional[bool]=None,
+            read_until_eof: bool=True,
+            proxy: Optional[StrOrURL]=None,
+            proxy_auth: Optional[BasicAuth]=None,
+            timeout: Union[ClientTimeout, object]=sentinel,
+            ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None,
+            proxy_headers: Optional[LooseHeaders]=None,
+            trace_request_ctx: Optional[SimpleNamespace]=None,
+            _method: str=hdrs.METH_PUT,
+            _rcm: Any=_RequestContextManager) -> '_RequestContextManager':
         """Perform HTTP PUT request."""
-        return _RequestContextManager(
-            self._request(hdrs.METH_PUT, url,
-                          data=data,
-                          **kwargs))
-
-    def patch(self, url: StrOrURL,
-              *, data: Any=None, **kwargs: Any) -> '_RequestContextManager':
+        return _rcm(
+            self._request(_method, url, params, data, json, cookies,
+                          headers, skip_auto_headers, auth,
+                          allow_redirects, max_redirects, compress,
+                          chunked, expect100, raise_for_status,
+                          read_until_eof, proxy, proxy_auth, timeout,
+                          ssl, proxy_headers, trace_request_ctx))
+
+    def patch(self, url: StrOrURL, *,
+              params: Optional[Mapping[str, str]]=None,
+              data: Any=None,
+              json: Any=None,
+              cookies: Optional[LooseCookies]=None,
+              headers: LooseHeaders=None,
+              skip_auto_headers: Optional[Iterable[str]]=None,
+              auth: Optional[BasicAuth]=None,
+              allow_redirects: bool=True,
+              max_redirects: int=10,
+              compress: Optional[str]=None,
+              chunked: Optional[bool]=None,
+              expect100: bool=False,
+              raise_for_status: Optional[bool]=None,
+              read_until_eof: bool=True,
+              proxy: Optional[StrOrURL]=None,
+              proxy_auth: Optional[BasicAuth]=None,
+              timeout: Union[ClientTimeout, object]=sentinel,
+              ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None,
+              proxy_headers: Optional[LooseHeaders]=None,
+              trace_request_ctx: Optional[SimpleNamespace]=None,
+              _method: str=hdrs.METH_PATCH,
+              _rcm: Any=_RequestContextManager) -> '_RequestContextManager':
         """Perform HTTP PATCH request."""
-        return _RequestContextManager(
-            self._request(hdrs.METH_PATCH, url,
-                          data=data,
-                          **kwargs))
-
-    def delete(self, url: StrOrURL, **kwargs: Any) -> '_RequestContextManager':
+        return _rcm(
+            self._request(_method, url, params, data, json, cookies,
+                          headers, skip_auto_headers, auth,
+                          allow_redirects, max_redirects, compress,
+                          chunked, expect100, raise_for_status,
+                          read_until_eof, proxy, proxy_auth, timeout,
+                          ssl, proxy_headers, trace_request_ctx))
+
+    def delete(self, url: StrOrURL, *,
+               params: Optional[Mapping[str, str]]=None,
+               data: Any=None,
+               json: Any=None,
+               cookies: Optional[LooseCookies]=None,
+               headers: LooseHeaders=None,
+               skip_auto_headers: Optional[Iterable[str]]=None,
+               auth: Optional[BasicAuth]=None,
+               allow_redirects: bool=True,
+               max_redirects: int=10,
+               compress: Optional[str]=None,
+               chunked: Optional[bool]=None,
+               expect100: bool=False,
+               raise_for_status: Optional[bool]=None,
+               read_until_eof: bool=True,
+               proxy: Optional[StrOrURL]=None,
+               proxy_auth: Optional[BasicAuth]=None,
+               timeout: Union[ClientTimeout, object]=sentinel,
+               ssl: Optional[Union[SSLContext, bool, Fingerprint]]=None,
+               proxy_headers: Optional[LooseHeaders]=None,
+               trace_request_ctx: Optional[SimpleNamespace]=None,
+               _method: str=hdrs.METH_DELETE,
+               _rcm: Any=_RequestContextManager
+               ) -> '_RequestContextManager':
         """Perform HTTP DELETE request."""
-        return _RequestContextManager(
-            self._request(hdrs.METH_DELETE, url,
-                          **kwargs))
+        return _rcm(
+            self._request(_method, url, params, data, json, cookies,
+                          headers, skip_auto_headers, auth,
+                          allow_redirects, max_redirects, compress,
+                          chunked, expect100, raise_for_status,
+                          read_until_eof, proxy, proxy_auth, timeout,
+                          ssl, proxy_headers, trace_request_ctx))
 
     async def close(self) -> None:
         """Close underlying connector.
@@ -885,6 +1639,7 @@ class ClientSession:
             if self._connector is not None and self._connector_owner:
                 await self._connector.close()
             self._connector = None
+            self._closed = True
 
     @property
     def closed(self) -> bool:
@@ -892,7 +1647,12 @@ class ClientSession:
 
         A readonly property.
         """
-        return self._connector is None or self._connector.closed
+        if self._closed:
+            return True
+        # the connector may have been closed behind our back,
+        # fall back to inspecting it
+        connector = self._connector
+        return connector is None or connector.closed
 
     @property
     def connector(self) -> Optional[BaseConnector]:
@@ -917,26 +1677,30 @@ class ClientSession:
     @requote_redirect_url.setter
     def requote_redirect_url(self, val: bool) -> None:
         """Do URL requoting on redirection handling."""
-        warnings.warn("session.requote_redirect_url modification "
-                      "is deprecated #2778",
-                      DeprecationWarning,
-                      stacklevel=2)
+        if not ClientSession._requote_warned:
+            # warn only once, warnings.warn() walks the stack and
+            # consults the warning registry even when filtered out
+            ClientSession._requote_warned = True
+            warnings.warn("session.requote_redirect_url modification "
+                          "is deprecated #2778",
+                          DeprecationWarning,
+                          stacklevel=2)
         self._requote_redirect_url = val
 
-    @property
-    def loop(self) -> asyncio.AbstractEventLoop:
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
         """Session's loop."""
-        warnings.warn("client.loop property is deprecated",
-                      DeprecationWarning,
-                      stacklevel=2)
         return self._loop
 
+    loop = _DeprecatedProperty(_get_loop,
+                               "client.loop property is deprecated")
+
     def detach(self) -> None:
         """Detach connector from session without closing the former.
 
         Session is switched to closed state anyway.
         """
         self._connector = None
+        self._closed = True
 
     def __enter__(self) -> None:
         raise TypeError("Use async with instead")
@@ -958,84 +1722,103 @@ class ClientSession:
         await self.close()
 
 
-class _BaseRequestContextManager(Coroutine[Any,
-                                           Any,
-                                           _RetType],
-                                 Generic[_RetType]):
+class _SessionRequestContextManager:
 
-    __slots__ = ('_coro', '_resp')
+    __slots__ = ('_coro', '_resp', '_session')
 
-    def __init__(
-            self,
-            coro: Coroutine['asyncio.Future[Any]', None, _RetType]
-    ) -> None:
+    def __init__(self,
+                 coro: Coroutine['asyncio.Future[Any]', None, ClientResponse],
+                 session: ClientSession) -> None:
         self._coro = coro
+        self._resp = None  # type: Optional[ClientResponse]
+        self._session = session
 
-    def send(self, arg: None) -> 'asyncio.Future[Any]':
-        return self._coro.send(arg)
-
-    def throw(self, arg: BaseException) -> None:  # type: ignore
-        self._coro.throw(arg)  # type: ignore
-
-    def close(self) -> None:
-        return self._coro.close()
-
-    def __await__(self) -> Generator[Any, None, _RetType]:
-        ret = self._coro.__await__()
-        return ret
-
-    def __iter__(self) -> Generator[Any, None, _RetType]:
-        return self.__await__()
-
-    async def __aenter__(self) -> _RetType:
+    async def __aenter__(self) -> ClientResponse:
         self._resp = await self._coro
         return self._resp
 
-
-class _RequestContextManager(_BaseRequestContextManager[ClientResponse]):
     async def __aexit__(self,
                         exc_type: Optional[Type[BaseException]],
                         exc: Optional[BaseException],
                         tb: Optional[TracebackType]) -> None:
-        # We're basing behavior on the exception as it can be caused by
-        # user code unrelated to the status of the connection.  If you
-        # would like to close a connection you must do that
-        # explicitly.  Otherwise connection error handling should kick in
-        # and close/recycle the connection as required.
-        self._resp.release()
-
+        # __aenter__ always sets _resp before __aexit__ can run,
+        # no need to guard; read both slots once
+        resp = self._resp
+        session = self._session
+        resp.close()  # type: ignore
+        await session.close()
 
-class _WSRequestContextManager(_BaseRequestContextManager[
-        ClientWebSocketResponse]):
-    async def __aexit__(self,
-                        exc_type: Optional[Type[BaseException]],
-                        exc: Optional[BaseException],
-                        tb: Optional[TracebackType]) -> None:
-        await self._resp.close()
 
+PySessionRequestContextManager = _SessionRequestContextManager
 
-class _SessionRequestContextManager:
+try:
+    from aiohttp._client_ctx import (  # type: ignore  # noqa
+        _SessionRequestContextManager as CSessionRequestContextManager,
+    )
+    if not NO_EXTENSIONS:
+        _SessionRequestContextManager = CSessionRequestContextManager  # type: ignore  # noqa
+except ImportError:  # pragma: no cover
+    pass
 
-    __slots__ = ('_coro', '_resp', '_session')
 
-    def __init__(self,
-                 coro: Coroutine['asyncio.Future[Any]', None, ClientResponse],
-                 session: ClientSession) -> None:
-        self._coro = coro
-        self._resp = None  # type: Optional[ClientResponse]
-        self._session = session
+class _SharedSessionRequestContextManager(_SessionRequestContextManager):
+    """Keeps the shared per-loop session alive on exit."""
 
-    async def __aenter__(self) -> ClientResponse:
-        self._resp = await self._coro
-        return self._resp
+    __slots__ = ()
 
     async def __aexit__(self,
                         exc_type: Optional[Type[BaseException]],
                         exc: Optional[BaseException],
                         tb: Optional[TracebackType]) -> None:
-        assert self._resp is not None
-        self._resp.close()
-        await self._session.close()
+        resp = self._resp
+        # release instead of close so the connection goes back
+        # to the shared pool
+        resp.release()  # type: ignore
+
+
+_shared_sessions = \
+    weakref.WeakValueDictionary()  # type: MutableMapping[int, ClientSession]
+
+
+def _get_shared_session(
+        loop: Optional[asyncio.AbstractEventLoop]) -> Optional[ClientSession]:
+    if loop is None:
+        loop = asyncio.get_event_loop()
+    # while the session is alive it pins the loop through session._loop,
+    # so its id cannot be reused for a different loop
+    session = _shared_sessions.get(id(loop))
+    if session is not None and not session.closed:
+        return session
+    loop_close = loop.close
+    try:
+        # probe before building the session: extension loops without an
+        # instance dict (e.g. uvloop) cannot be patched, so fall back to
+        # a per-call session instead of leaking a half-installed one
+        loop.close = loop_close  # type: ignore
+    except AttributeError:
+        return None
+    session = ClientSession(
+        loop=loop,
+        connector=TCPConnector(loop=loop, limit=100, ttl_dns_cache=300))
+
+    def close() -> None:
+        # drain the shared session right before its loop goes away;
+        # close() is only legal on a non-running loop
+        if (not session.closed and
+                not loop.is_closed() and
+                not loop.is_running()):
+            loop.run_until_complete(session.close())
+        loop_close()
+
+    # the patched close both anchors the session for the lifetime of
+    # the loop and disposes of it during loop shutdown.  A loop that
+    # is abandoned without close() leaves only the
+    # loop -> close -> session -> loop cycle, which the garbage
+    # collector reclaims as a unit; the weak-valued registry entry
+    # vanishes with it.
+    loop.close = close  # type: ignore
+    _shared_sessions[id(loop)] = session
+    return session
 
 
 def request(
@@ -1095,7 +1878,41 @@ def request(
       >>> resp
       <ClientResponse(python.org/) [200]>
       >>> data = await resp.read()
+
+    When neither connector nor cookies are given the request is sent
+    through a shared per-loop session with a pooled connector, so
+    keep-alive connections, TLS sessions, cached DNS results and the
+    cookie jar are reused between calls: cookies set by servers persist
+    across request() invocations on the same loop (pass cookies, e.g.
+    an empty dict, to get an isolated per-call session instead).  The
+    shared session is closed together with its event loop.
     """
+    shared_session = None
+    if (connector is None and cookies is None and
+            version is http.HttpVersion11):
+        shared_session = _get_shared_session(loop)
+    if shared_session is not None:
+        session = shared_session
+        return _SharedSessionRequestContextManager(
+            session._request(method, url,
+                             params=params,
+                             data=data,
+                             json=json,
+                             headers=headers,
+                             skip_auto_headers=skip_auto_headers,
+                             auth=auth,
+                             allow_redirects=allow_redirects,
+                             max_redirects=max_redirects,
+                             compress=compress,
+                             chunked=chunked,
+                             expect100=expect100,
+                             raise_for_status=raise_for_status,
+                             read_until_eof=read_until_eof,
+                             proxy=proxy,
+                             proxy_auth=proxy_auth,
+                             timeout=timeout),
+            session)
+
     connector_owner = False
     if connector is None:
         connector_owner = True
@@ -29,6 +29,7 @@ from typing import (  # noqa
 )
 
 import attr
+from multidict import CIMultiDict
 
 from . import hdrs, helpers
 from .abc import AbstractResolver
@@ -1013,9 +1014,14 @@ class TCPConnector(BaseConnector):
             traces: List['Trace'],
             timeout: 'ClientTimeout'
     ) -> Tuple[asyncio.Transport, ResponseHandler]:
-        headers = {}  # type: Dict[str, str]
         if req.proxy_headers is not None:
-            headers = req.proxy_headers  # type: ignore
+            # Copy to keep req.proxy_headers intact; it may be a
+            # read-only view shared between requests.  CIMultiDict keeps
+            # duplicates and lets the Host assignment below replace any
+            # caller-supplied spelling case-insensitively.
+            headers = CIMultiDict(req.proxy_headers)  # type: CIMultiDict[str]
+        else:
+            headers = CIMultiDict()
         headers[hdrs.HOST] = req.headers[hdrs.HOST]
 
         url = req.proxy
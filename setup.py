@@ -39,6 +39,10 @@ extensions = [Extension('aiohttp._websocket', ['aiohttp/_websocket.c']),
                          'aiohttp/_find_header.c'],
                         define_macros=[('HTTP_PARSER_STRICT', 0)],
                         ),
+              Extension('aiohttp._client_ctx',
+                        ['aiohttp/_client_ctx.c']),
+              Extension('aiohttp._client_helpers',
+                        ['aiohttp/_client_helpers.c']),
               Extension('aiohttp._frozenlist',
                         ['aiohttp/_frozenlist.c']),
               Extension('aiohttp._helpers',
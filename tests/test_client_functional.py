@@ -2348,6 +2348,92 @@ async def test_aiohttp_request_context_manager(aiohttp_server) -> None:
         assert resp.status == 200
 
 
+async def test_aiohttp_request_shared_session(aiohttp_server) -> None:
+    async def handler(request):
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get('/', handler)
+    server = await aiohttp_server(app)
+
+    loop = asyncio.get_event_loop()
+    async with aiohttp.request('GET', server.make_url('/')) as resp:
+        assert resp.status == 200
+    session = aiohttp.client._shared_sessions.get(id(loop))
+    assert session is not None
+    assert not session.closed
+    # the keep-alive connection went back to the shared pool
+    assert sum(len(conns)
+               for conns in session.connector._conns.values()) == 1
+
+    async with aiohttp.request('GET', server.make_url('/')) as resp:
+        assert resp.status == 200
+    assert aiohttp.client._shared_sessions.get(id(loop)) is session
+    # still one pooled connection: the second call reused it
+    assert sum(len(conns)
+               for conns in session.connector._conns.values()) == 1
+
+
+async def test_aiohttp_request_shared_cookie_jar(aiohttp_server) -> None:
+    async def set_cookie(request):
+        resp = web.Response()
+        resp.set_cookie('shared', 'value')
+        return resp
+
+    async def echo_cookie(request):
+        return web.Response(text=request.cookies.get('shared', 'missing'))
+
+    app = web.Application()
+    app.router.add_get('/set', set_cookie)
+    app.router.add_get('/get', echo_cookie)
+    server = await aiohttp_server(app)
+    # the default CookieJar refuses cookies from bare IP addresses, so
+    # address the server by hostname
+    url = server.make_url('/').with_host('localhost')
+
+    async with aiohttp.request('GET', url.with_path('/set')) as resp:
+        assert resp.status == 200
+    # the shared session's jar sends the cookie back on the next call
+    async with aiohttp.request('GET', url.with_path('/get')) as resp:
+        assert await resp.text() == 'value'
+    # an explicit cookies argument opts out into an isolated session
+    async with aiohttp.request('GET', url.with_path('/get'),
+                               cookies={}) as resp:
+        assert await resp.text() == 'missing'
+
+
+def test_aiohttp_request_loop_close_drains_shared_session() -> None:
+    another_loop = asyncio.new_event_loop()
+
+    async def make():
+        return aiohttp.client._get_shared_session(another_loop)
+
+    session = another_loop.run_until_complete(make())
+    assert session is not None
+    assert not session.closed
+    another_loop.close()
+    assert session.closed
+    assert another_loop.is_closed()
+
+
+async def test_aiohttp_request_unpatchable_loop(loop) -> None:
+    class SlottedLoop:
+        # stand-in for extension loops (e.g. uvloop) whose close
+        # attribute cannot be replaced
+        __slots__ = ('_loop',)
+
+        def __init__(self, loop):
+            self._loop = loop
+
+        def __getattr__(self, name):
+            return getattr(self._loop, name)
+
+    patchless = SlottedLoop(loop)
+    # no shared session can be anchored to such a loop; request()
+    # falls back to the per-call session path
+    assert aiohttp.client._get_shared_session(patchless) is None
+
+
 async def test_aiohttp_request_ctx_manager_not_found() -> None:
 
     with pytest.raises(aiohttp.ClientConnectionError):
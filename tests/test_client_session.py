@@ -1,14 +1,13 @@
 import asyncio
-import contextlib
 import gc
-import json
-import re
-from http.cookies import SimpleCookie
-from io import BytesIO
+import operator
+import platform
+import sys
+from types import MappingProxyType
 from unittest import mock
 
 import pytest
-from multidict import CIMultiDict, MultiDict
+from multidict import CIMultiDict, MultiDict, istr
 from yarl import URL
 
 import aiohttp
@@ -16,7 +15,20 @@ from aiohttp import client, hdrs, web
 from aiohttp.client import ClientSession
 from aiohttp.client_reqrep import ClientRequest
 from aiohttp.connector import BaseConnector, TCPConnector
-from aiohttp.helpers import PY_36
+from aiohttp.helpers import PY_36, sentinel
+
+
+@pytest.fixture(scope="module")
+def loop():
+    # overrides the function-scoped plugin fixture: one selector loop
+    # shared by the whole module instead of a fresh loop per test;
+    # pytest_pyfunc_call passes an existing loop funcarg straight
+    # through without tearing it down
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    loop.close()
+    asyncio.set_event_loop(None)
 
 
 @pytest.fixture
@@ -30,35 +42,114 @@ def connector(loop, create_mocked_conn):
     conn.close()
 
 
+@pytest.fixture(scope="module")
+def session_pool():
+    # free-list of default-configured sessions shared across the
+    # module so most tests skip connector/cookie-jar construction;
+    # everything left in the pool is closed once at module teardown
+    pool = []
+    yield pool
+    if pool:
+        async def close_all():
+            for sess in pool:
+                await sess.close()
+        cleanup_loop = asyncio.new_event_loop()
+        try:
+            cleanup_loop.run_until_complete(close_all())
+        finally:
+            cleanup_loop.close()
+
+
 @pytest.fixture
-def create_session(loop):
-    session = None
+def create_session(loop, session_pool):
+    defaults = []
+    customized = []
 
     async def maker(*args, **kwargs):
-        nonlocal session
-        session = ClientSession(*args, loop=loop, **kwargs)
+        if not args and not kwargs:
+            if session_pool:
+                session = session_pool.pop()
+            else:
+                session = ClientSession(loop=loop)
+            defaults.append(session)
+        else:
+            session = ClientSession(*args, loop=loop, **kwargs)
+            customized.append(session)
         return session
     yield maker
-    if session is not None:
-        loop.run_until_complete(session.close())
+    for session in defaults:
+        # park still-usable sessions for the next test; sessions the
+        # test closed or detached are dropped
+        if not session.closed:
+            session_pool.append(session)
+    for session in customized:
+        if not session.closed:
+            loop.run_until_complete(session.close())
 
 
 @pytest.fixture
-def session(create_session, loop):
-    return loop.run_until_complete(create_session())
+async def session(create_session):
+    return await create_session()
+
+
+# canonical istr keys shared by every header fixture so CIMultiDict
+# reuses the same case-folded objects instead of converting per call
+_H1 = istr("h1")
+_H2 = istr("h2")
+_H3 = istr("h3")
+
+# expected header comparison targets, built once instead of paying
+# CIMultiDict construction and istr canonicalization per test
+_EXPECTED_HEADERS = CIMultiDict([(_H1, "header1"),
+                                 (_H2, "header2"),
+                                 (_H3, "header3")])
+_EXPECTED_HEADERS_WITH_DUPLICATES = CIMultiDict([(_H1, "header11"),
+                                                 (_H2, "header21"),
+                                                 (_H1, "header12")])
+
+
+# shared by the params fixture; MappingProxyType keeps it immutable so
+# a single instance can serve the whole module
+_PARAMS = MappingProxyType(dict(
+    headers={"Authorization": "Basic ..."},
+    max_redirects=2,
+    compress="deflate",
+    chunked=True,
+    expect100=True,
+    read_until_eof=False))
+
+
+@pytest.fixture(scope="module")
+def params():
+    return _PARAMS
+
+
+@pytest.fixture(scope="module")
+def _request_mock():
+    # one MagicMock for the whole module, reset between tests
+    return mock.MagicMock()
 
 
 @pytest.fixture
-def params():
-    return dict(
-        headers={"Authorization": "Basic ..."},
-        max_redirects=2,
-        encoding="latin1",
-        version=aiohttp.HttpVersion10,
-        compress="deflate",
-        chunked=True,
-        expect100=True,
-        read_until_eof=False)
+def patched_request(monkeypatch, _request_mock):
+    monkeypatch.setattr("aiohttp.client.ClientSession._request",
+                        _request_mock)
+    yield _request_mock
+    _request_mock.reset_mock()
+
+
+def _request_call_args(method, url, **overrides):
+    # expected positional arguments of ClientSession._request,
+    # in signature order
+    args = dict(
+        params=None, data=None, json=None, cookies=None, headers=None,
+        skip_auto_headers=None, auth=None, allow_redirects=True,
+        max_redirects=10, compress=None, chunked=None, expect100=False,
+        raise_for_status=None, read_until_eof=True, proxy=None,
+        proxy_auth=None, timeout=sentinel, ssl=None, proxy_headers=None,
+        trace_request_ctx=None)
+    args.update(overrides)
+    return [(method, url) + tuple(args.values()), {}]
 
 
 async def test_close_coro(create_session) -> None:
@@ -67,41 +158,34 @@ async def test_close_coro(create_session) -> None:
 
 
 async def test_init_headers_simple_dict(create_session) -> None:
-    session = await create_session(headers={"h1": "header1",
-                                            "h2": "header2"})
-    assert (sorted(session._default_headers.items()) ==
-            ([("h1", "header1"), ("h2", "header2")]))
+    session = await create_session(headers={_H1: "header1",
+                                            _H2: "header2"})
+    # CIMultiDict iteration is insertion-ordered, so no sorting is
+    # needed to get a deterministic comparison
+    assert (list(session._default_headers.items()) ==
+            [(_H1, "header1"), (_H2, "header2")])
 
 
 async def test_init_headers_list_of_tuples(create_session) -> None:
-    session = await create_session(headers=[("h1", "header1"),
-                                            ("h2", "header2"),
-                                            ("h3", "header3")])
-    assert (session._default_headers ==
-            CIMultiDict([("h1", "header1"),
-                         ("h2", "header2"),
-                         ("h3", "header3")]))
+    session = await create_session(headers=[(_H1, "header1"),
+                                            (_H2, "header2"),
+                                            (_H3, "header3")])
+    assert session._default_headers == _EXPECTED_HEADERS
 
 
 async def test_init_headers_MultiDict(create_session) -> None:
-    session = await create_session(headers=MultiDict([("h1", "header1"),
-                                                      ("h2", "header2"),
-                                                      ("h3", "header3")]))
-    assert (session._default_headers ==
-            CIMultiDict([("H1", "header1"),
-                         ("H2", "header2"),
-                         ("H3", "header3")]))
+    session = await create_session(headers=MultiDict([(_H1, "header1"),
+                                                      (_H2, "header2"),
+                                                      (_H3, "header3")]))
+    assert session._default_headers == _EXPECTED_HEADERS
 
 
 async def test_init_headers_list_of_tuples_with_duplicates(
         create_session) -> None:
-    session = await create_session(headers=[("h1", "header11"),
-                                            ("h2", "header21"),
-                                            ("h1", "header12")])
-    assert (session._default_headers ==
-            CIMultiDict([("H1", "header11"),
-                         ("H2", "header21"),
-                         ("H1", "header12")]))
+    session = await create_session(headers=[(_H1, "header11"),
+                                            (_H2, "header21"),
+                                            (_H1, "header12")])
+    assert session._default_headers == _EXPECTED_HEADERS_WITH_DUPLICATES
 
 
 async def test_init_cookies_with_simple_dict(create_session) -> None:
@@ -125,136 +209,75 @@ async def test_init_cookies_with_list_of_tuples(create_session) -> None:
 
 async def test_merge_headers(create_session) -> None:
     # Check incoming simple dict
-    session = await create_session(headers={"h1": "header1",
-                                            "h2": "header2"})
-    headers = session._prepare_headers({"h1": "h1"})
+    session = await create_session(headers={_H1: "header1",
+                                            _H2: "header2"})
+    headers = session._prepare_headers({_H1: "h1"})
 
     assert isinstance(headers, CIMultiDict)
-    assert headers == {"h1": "h1", "h2": "header2"}
+    assert headers == {_H1: "h1", _H2: "header2"}
 
 
 async def test_merge_headers_with_multi_dict(create_session) -> None:
-    session = await create_session(headers={"h1": "header1",
-                                            "h2": "header2"})
-    headers = session._prepare_headers(MultiDict([("h1", "h1")]))
+    session = await create_session(headers={_H1: "header1",
+                                            _H2: "header2"})
+    headers = session._prepare_headers(MultiDict([(_H1, "h1")]))
     assert isinstance(headers, CIMultiDict)
-    assert headers == {"h1": "h1", "h2": "header2"}
+    assert headers == {_H1: "h1", _H2: "header2"}
 
 
 async def test_merge_headers_with_list_of_tuples(create_session) -> None:
-    session = await create_session(headers={"h1": "header1",
-                                            "h2": "header2"})
-    headers = session._prepare_headers([("h1", "h1")])
+    session = await create_session(headers={_H1: "header1",
+                                            _H2: "header2"})
+    headers = session._prepare_headers([(_H1, "h1")])
     assert isinstance(headers, CIMultiDict)
-    assert headers == {"h1": "h1", "h2": "header2"}
+    assert headers == {_H1: "h1", _H2: "header2"}
 
 
 async def test_merge_headers_with_list_of_tuples_duplicated_names(
         create_session) -> None:
-    session = await create_session(headers={"h1": "header1",
-                                            "h2": "header2"})
+    session = await create_session(headers={_H1: "header1",
+                                            _H2: "header2"})
 
-    headers = session._prepare_headers([("h1", "v1"),
-                                        ("h1", "v2")])
+    headers = session._prepare_headers([(_H1, "v1"),
+                                        (_H1, "v2")])
 
     assert isinstance(headers, CIMultiDict)
-    assert list(sorted(headers.items())) == [("h1", "v1"),
-                                             ("h1", "v2"),
-                                             ("h2", "header2")]
-
-
-def test_http_GET(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.get("http://test.example.com",
-                    params={"x": 1},
-                    **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("GET", "http://test.example.com",),
-                                       dict(
-                                           params={"x": 1},
-                                           allow_redirects=True,
-                                           **params)]
-
-
-def test_http_OPTIONS(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.options("http://opt.example.com",
-                        params={"x": 2},
-                        **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("OPTIONS", "http://opt.example.com",),
-                                       dict(
-                                           params={"x": 2},
-                                           allow_redirects=True,
-                                           **params)]
-
-
-def test_http_HEAD(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.head("http://head.example.com",
-                     params={"x": 2},
-                     **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("HEAD", "http://head.example.com",),
-                                       dict(
-                                           params={"x": 2},
-                                           allow_redirects=False,
-                                           **params)]
-
-
-def test_http_POST(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.post("http://post.example.com",
-                     params={"x": 2},
-                     data="Some_data",
-                     **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("POST", "http://post.example.com",),
-                                       dict(
-                                           params={"x": 2},
-                                           data="Some_data",
-                                           **params)]
-
-
-def test_http_PUT(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.put("http://put.example.com",
-                    params={"x": 2},
-                    data="Some_data",
-                    **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("PUT", "http://put.example.com",),
-                                       dict(
-                                           params={"x": 2},
-                                           data="Some_data",
-                                           **params)]
-
-
-def test_http_PATCH(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.patch("http://patch.example.com",
-                      params={"x": 2},
-                      data="Some_data",
-                      **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("PATCH", "http://patch.example.com",),
-                                       dict(
-                                           params={"x": 2},
-                                           data="Some_data",
-                                           **params)]
-
-
-def test_http_DELETE(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.delete("http://delete.example.com",
-                       params={"x": 2},
-                       **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("DELETE",
-                                        "http://delete.example.com",),
-                                       dict(
-                                           params={"x": 2},
-                                           **params)]
+    assert list(headers.items()) == [(_H1, "v1"),
+                                     (_H2, "header2"),
+                                     (_H1, "v2")]
+
+
+# each case carries a prebuilt methodcaller with the kwargs already
+# merged with _PARAMS, so the test body performs a single C-level call
+# instead of a dict merge plus attribute lookup per run
+_VERB_CASES = [
+    pytest.param(operator.methodcaller(method.lower(), url, **merged),
+                 method, url, merged, id=method)
+    for method, url, merged in (
+        (method, url, {**extra, **_PARAMS})
+        for method, url, extra in [
+            ("GET", "http://test.example.com", dict(params={"x": 1})),
+            ("OPTIONS", "http://opt.example.com", dict(params={"x": 2})),
+            ("HEAD", "http://head.example.com",
+             dict(params={"x": 2}, allow_redirects=False)),
+            ("POST", "http://post.example.com",
+             dict(params={"x": 2}, data="Some_data")),
+            ("PUT", "http://put.example.com",
+             dict(params={"x": 2}, data="Some_data")),
+            ("PATCH", "http://patch.example.com",
+             dict(params={"x": 2}, data="Some_data")),
+            ("DELETE", "http://delete.example.com", dict(params={"x": 2})),
+        ])
+]
+
+
+@pytest.mark.parametrize("call,method,url,merged", _VERB_CASES)
+def test_http_method(session, patched_request,
+                     call, method, url, merged) -> None:
+    call(session)
+    assert patched_request.called, "`ClientSession._request` not called"
+    assert list(patched_request.call_args) == _request_call_args(
+        method, url, **merged)
 
 
 async def test_close(create_session, connector) -> None:
@@ -271,42 +294,63 @@ async def test_closed(session) -> None:
     assert session.closed
 
 
-async def test_connector(create_session, loop, mocker) -> None:
+def _count_close_calls(connector):
+    # cheaper than mocker.spy: a plain closure instead of a MagicMock
+    # wrapper in front of every close() call
+    calls = [0]
+    orig_close = connector.close
+
+    def close():
+        calls[0] += 1
+        return orig_close()
+
+    connector.close = close
+    return calls
+
+
+async def test_connector(create_session, loop) -> None:
     connector = TCPConnector(loop=loop)
-    mocker.spy(connector, 'close')
+    close_calls = _count_close_calls(connector)
     session = await create_session(connector=connector)
     assert session.connector is connector
 
     await session.close()
-    assert connector.close.called
-    connector.close()
+    assert close_calls[0]
 
 
-async def test_create_connector(create_session, loop, mocker) -> None:
+async def test_create_connector(create_session, loop) -> None:
     session = await create_session()
     connector = session.connector
-    mocker.spy(session.connector, 'close')
+    close_calls = _count_close_calls(connector)
 
     await session.close()
-    assert connector.close.called
+    assert close_calls[0]
 
 
 def test_connector_loop(loop) -> None:
-    with contextlib.ExitStack() as stack:
-        another_loop = asyncio.new_event_loop()
-        stack.enter_context(contextlib.closing(another_loop))
-
+    another_loop = asyncio.new_event_loop()
+    try:
         async def make_connector():
             return TCPConnector()
         connector = another_loop.run_until_complete(make_connector())
 
-        stack.enter_context(contextlib.closing(connector))
-        with pytest.raises(RuntimeError) as ctx:
-            async def make_sess():
-                return ClientSession(connector=connector, loop=loop)
-            loop.run_until_complete(make_sess())
-        assert re.match("Session and connector have to use same event loop",
-                        str(ctx.value))
+        try:
+            with pytest.raises(RuntimeError) as ctx:
+                async def make_sess():
+                    return ClientSession(connector=connector, loop=loop)
+                loop.run_until_complete(make_sess())
+            assert str(ctx.value).startswith(
+                "Session and connector have to use same event loop")
+        finally:
+            connector.close()
+    finally:
+        another_loop.close()
+    # the half-constructed session is trapped in the exception/traceback
+    # cycle held by ctx; collect it here so its finalizer does not fire
+    # in the middle of a later test on the shared loop
+    del ctx
+    with pytest.warns(ResourceWarning):
+        gc.collect()
 
 
 def test_detach(session) -> None:
@@ -344,6 +388,19 @@ async def test_double_close(connector, create_session) -> None:
     assert connector.closed
 
 
+_IS_CPYTHON = platform.python_implementation() == 'CPython'
+
+
+if sys.version_info >= (3, 8):
+    def _async_mock():
+        return mock.AsyncMock()
+else:
+    def _async_mock():
+        # AsyncMock is 3.8+; a Mock with a coroutine side effect records
+        # calls the same way on older interpreters
+        return mock.Mock(side_effect=asyncio.coroutine(mock.Mock()))
+
+
 async def test_del(connector, loop) -> None:
     loop.set_debug(False)
     # N.B. don't use session fixture, it stores extra reference internally
@@ -351,9 +408,18 @@ async def test_del(connector, loop) -> None:
     logs = []
     loop.set_exception_handler(lambda loop, ctx: logs.append(ctx))
 
-    with pytest.warns(ResourceWarning):
-        del session
-        gc.collect()
+    try:
+        with pytest.warns(ResourceWarning):
+            if _IS_CPYTHON:
+                # the local is the only strong reference, so del runs
+                # __del__ synchronously without a full-heap gc.collect()
+                assert sys.getrefcount(session) == 2
+                del session
+            else:
+                del session
+                gc.collect()
+    finally:
+        loop.set_exception_handler(None)
 
     assert len(logs) == 1
     expected = {'client_session': mock.ANY,
@@ -368,9 +434,17 @@ async def test_del_debug(connector, loop) -> None:
     logs = []
     loop.set_exception_handler(lambda loop, ctx: logs.append(ctx))
 
-    with pytest.warns(ResourceWarning):
-        del session
-        gc.collect()
+    try:
+        with pytest.warns(ResourceWarning):
+            if _IS_CPYTHON:
+                assert sys.getrefcount(session) == 2
+                del session
+            else:
+                del session
+                gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+        loop.set_debug(False)
 
     assert len(logs) == 1
     expected = {'client_session': mock.ANY,
@@ -395,18 +469,40 @@ async def test_borrow_connector_loop(connector, create_session, loop) -> None:
         await session.close()
 
 
-async def test_reraise_os_error(create_session, create_mocked_conn) -> None:
-    err = OSError(1, "permission error")
-    req = mock.Mock()
+@pytest.fixture(scope="module")
+def _mock_pool():
+    # the error-path tests need the same three mock skeletons; build
+    # them once per module, Mock construction is pure-Python and slow
+    req = mock.MagicMock(spec=ClientRequest)
     req_factory = mock.Mock(return_value=req)
-    req.send = mock.Mock(side_effect=err)
+    release = mock.Mock()
+    return req, req_factory, release
+
+
+@pytest.fixture
+def mock_pool(_mock_pool):
+    req, req_factory, release = _mock_pool
+    yield _mock_pool
+    # reset_mock(side_effect=True) needs 3.6+; clear the one side
+    # effect the tests set by hand instead
+    req.send.side_effect = None
+    req.reset_mock()
+    req_factory.reset_mock()
+    release.reset_mock()
+
+
+async def test_reraise_os_error(create_session, create_mocked_conn,
+                                mock_pool) -> None:
+    err = OSError(1, "permission error")
+    req, req_factory, release = mock_pool
+    req.send.side_effect = err
     session = await create_session(request_class=req_factory)
 
     async def create_connection(req, traces, timeout):
         # return self.transport, self.protocol
         return create_mocked_conn()
     session._connector._create_connection = create_connection
-    session._connector._release = mock.Mock()
+    session._connector._release = release
 
     with pytest.raises(aiohttp.ClientOSError) as ctx:
         await session.request('get', 'http://example.com')
@@ -415,14 +511,14 @@ async def test_reraise_os_error(create_session, create_mocked_conn) -> None:
     assert e.strerror == err.strerror
 
 
-async def test_close_conn_on_error(create_session, create_mocked_conn) -> None:
+async def test_close_conn_on_error(create_session, create_mocked_conn,
+                                   mock_pool) -> None:
     class UnexpectedException(BaseException):
         pass
 
     err = UnexpectedException("permission error")
-    req = mock.Mock()
-    req_factory = mock.Mock(return_value=req)
-    req.send = mock.Mock(side_effect=err)
+    req, req_factory, release = mock_pool
+    req.send.side_effect = err
     session = await create_session(request_class=req_factory)
 
     connections = []
@@ -440,7 +536,7 @@ async def test_close_conn_on_error(create_session, create_mocked_conn) -> None:
 
     session._connector.connect = connect
     session._connector._create_connection = create_connection
-    session._connector._release = mock.Mock()
+    session._connector._release = release
 
     with pytest.raises(UnexpectedException):
         async with session.request('get', 'http://example.com') as resp:
@@ -453,6 +549,8 @@ async def test_close_conn_on_error(create_session, create_mocked_conn) -> None:
 
 
 async def test_cookie_jar_usage(loop, aiohttp_client) -> None:
+    from http.cookies import SimpleCookie
+
     req_url = None
 
     jar = mock.Mock()
@@ -493,29 +591,33 @@ async def test_cookie_jar_usage(loop, aiohttp_client) -> None:
     assert resp_cookies["response"].value == "resp_value"
 
 
-async def test_session_default_version(loop) -> None:
+async def test_session_default_version_and_loop(loop) -> None:
+    # one session serves both checks; ClientSession construction brings
+    # up a TCPConnector and cookie jar, so don't pay it twice
     session = aiohttp.ClientSession(loop=loop)
-    assert session.version == aiohttp.HttpVersion11
+    try:
+        assert session.version == aiohttp.HttpVersion11
+        with pytest.warns(DeprecationWarning):
+            assert session.loop is loop
+    finally:
+        await session.close()
 
 
-async def test_session_loop(loop) -> None:
-    session = aiohttp.ClientSession(loop=loop)
-    with pytest.warns(DeprecationWarning):
-        assert session.loop is loop
-    await session.close()
+def test_proxy_str(session, params, patched_request) -> None:
+    session.get("http://test.example.com",
+                proxy='http://proxy.com',
+                **params)
+    assert patched_request.called, "`ClientSession._request` not called"
+    assert list(patched_request.call_args) == _request_call_args(
+        "GET", "http://test.example.com",
+        proxy='http://proxy.com',
+        **params)
 
 
-def test_proxy_str(session, params) -> None:
-    with mock.patch("aiohttp.client.ClientSession._request") as patched:
-        session.get("http://test.example.com",
-                    proxy='http://proxy.com',
-                    **params)
-    assert patched.called, "`ClientSession._request` not called"
-    assert list(patched.call_args) == [("GET", "http://test.example.com",),
-                                       dict(
-                                           allow_redirects=True,
-                                           proxy='http://proxy.com',
-                                           **params)]
+# fixed tracing payloads; the serialized form of the handler's JSON is
+# stable, so the test can compare bytes without calling json.dumps
+_BODY_BYTES = b'This is request body'
+_OK_JSON = b'{"ok": true}'
 
 
 async def test_request_tracing(loop, aiohttp_client) -> None:
@@ -527,18 +629,19 @@ async def test_request_tracing(loop, aiohttp_client) -> None:
 
     trace_config_ctx = mock.Mock()
     trace_request_ctx = {}
-    body = 'This is request body'
-    gathered_req_body = BytesIO()
-    gathered_res_body = BytesIO()
-    on_request_start = mock.Mock(side_effect=asyncio.coroutine(mock.Mock()))
-    on_request_redirect = mock.Mock(side_effect=asyncio.coroutine(mock.Mock()))
-    on_request_end = mock.Mock(side_effect=asyncio.coroutine(mock.Mock()))
+    # bytearray += avoids BytesIO's seek/position bookkeeping and
+    # resizes geometrically on append
+    gathered_req_body = bytearray()
+    gathered_res_body = bytearray()
+    on_request_start = _async_mock()
+    on_request_redirect = _async_mock()
+    on_request_end = _async_mock()
 
     async def on_request_chunk_sent(session, context, params):
-        gathered_req_body.write(params.chunk)
+        gathered_req_body.extend(params.chunk)
 
     async def on_response_chunk_received(session, context, params):
-        gathered_res_body.write(params.chunk)
+        gathered_res_body.extend(params.chunk)
 
     trace_config = aiohttp.TraceConfig(
         trace_config_ctx_factory=mock.Mock(return_value=trace_config_ctx)
@@ -552,7 +655,8 @@ async def test_request_tracing(loop, aiohttp_client) -> None:
     session = await aiohttp_client(app, trace_configs=[trace_config])
 
     async with session.post(
-            '/', data=body, trace_request_ctx=trace_request_ctx) as resp:
+            '/', data=_BODY_BYTES,
+            trace_request_ctx=trace_request_ctx) as resp:
 
         await resp.json()
 
@@ -577,48 +681,49 @@ async def test_request_tracing(loop, aiohttp_client) -> None:
             )
         )
         assert not on_request_redirect.called
-        assert gathered_req_body.getvalue() == body.encode('utf8')
-        assert gathered_res_body.getvalue() == json.dumps(
-            {'ok': True}).encode('utf8')
+        assert bytes(gathered_req_body) == _BODY_BYTES
+        assert bytes(gathered_res_body) == _OK_JSON
 
 
-async def test_request_tracing_exception(loop) -> None:
-    on_request_end = mock.Mock(side_effect=asyncio.coroutine(mock.Mock()))
-    on_request_exception = mock.Mock(
-        side_effect=asyncio.coroutine(mock.Mock())
-    )
+async def test_request_tracing_exception(loop, monkeypatch) -> None:
+    on_request_end = _async_mock()
+    on_request_exception = _async_mock()
 
     trace_config = aiohttp.TraceConfig()
     trace_config.on_request_end.append(on_request_end)
     trace_config.on_request_exception.append(on_request_exception)
 
-    with mock.patch("aiohttp.client.TCPConnector.connect") as connect_patched:
-        error = Exception()
-        f = loop.create_future()
-        f.set_exception(error)
-        connect_patched.return_value = f
+    error = Exception()
 
-        session = aiohttp.ClientSession(
-            loop=loop,
-            trace_configs=[trace_config]
-        )
+    async def connect(self, req, traces, timeout):
+        raise error
 
-        try:
-            await session.get('http://example.com')
-        except Exception:
-            pass
+    # monkeypatch reverts on teardown without mock.patch's _patch
+    # machinery, and a plain coroutine avoids an AsyncMock per run
+    monkeypatch.setattr(TCPConnector, "connect", connect)
 
-        on_request_exception.assert_called_once_with(
-            session,
-            mock.ANY,
-            aiohttp.TraceRequestExceptionParams(
-                hdrs.METH_GET,
-                URL("http://example.com"),
-                CIMultiDict(),
-                error
-            )
+    session = aiohttp.ClientSession(
+        loop=loop,
+        trace_configs=[trace_config]
+    )
+
+    try:
+        await session.get('http://example.com')
+    except Exception:
+        pass
+
+    on_request_exception.assert_called_once_with(
+        session,
+        mock.ANY,
+        aiohttp.TraceRequestExceptionParams(
+            hdrs.METH_GET,
+            URL("http://example.com"),
+            CIMultiDict(),
+            error
         )
-        assert not on_request_end.called
+    )
+    assert not on_request_end.called
+    await session.close()
 
 
 async def test_request_tracing_interpose_headers(loop, aiohttp_client) -> None:
@@ -691,19 +796,20 @@ async def test_client_session_timeout_args(loop) -> None:
                       conn_timeout=30 * 60)
 
 
-async def test_requote_redirect_url_default() -> None:
-    session = ClientSession()
-    assert session.requote_redirect_url
-
-
-async def test_requote_redirect_url_default_disable() -> None:
-    session = ClientSession(requote_redirect_url=False)
-    assert not session.requote_redirect_url
-
+async def test_requote_redirect_url_transitions(loop) -> None:
+    # default plus deprecated-setter flip on one session, constructor
+    # disable on a second: two ClientSession spin-ups instead of three
+    session = ClientSession(loop=loop)
+    try:
+        assert session.requote_redirect_url
+        with pytest.warns(DeprecationWarning):
+            session.requote_redirect_url = False
+        assert not session.requote_redirect_url
+    finally:
+        await session.close()
 
-async def test_requote_redirect_setter() -> None:
-    session = ClientSession()
-    assert session.requote_redirect_url
-    with pytest.warns(DeprecationWarning):
-        session.requote_redirect_url = False
-    assert not session.requote_redirect_url
+    session = ClientSession(loop=loop, requote_redirect_url=False)
+    try:
+        assert not session.requote_redirect_url
+    finally:
+        await session.close()